@@ -1,258 +1,470 @@
-import os
-import pickle
-from typing import List, Dict, Any, Tuple
-import faiss
-import numpy as np
-from sentence_transformers import SentenceTransformer
-
-
-class DocumentRetriever:
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
-        """Initialize the retriever with sentence transformer model."""
-        self.model = SentenceTransformer(model_name)
-        self.index = None
-        self.documents = []
-        self.metadata = []
-        self.is_loaded = False
-    
-    def load_index(self, index_path: str, metadata_path: str) -> bool:
-        """Load the FAISS index and metadata."""
-        try:
-            if not os.path.exists(index_path) or not os.path.exists(metadata_path):
-                print(f"Index or metadata file not found: {index_path}, {metadata_path}")
-                return False
-            
-            # Load FAISS index
-            self.index = faiss.read_index(index_path)
-            
-            # Load metadata
-            with open(metadata_path, 'rb') as f:
-                data = pickle.load(f)
-                self.documents = data['documents']
-                self.metadata = data['metadata']
-            
-            self.is_loaded = True
-            print(f"Loaded index with {len(self.documents)} documents")
-            return True
-            
-        except Exception as e:
-            print(f"Error loading index: {e}")
-            return False
-    
-    def search(self, query: str, top_k: int = 5, score_threshold: float = 0.1) -> List[Dict[str, Any]]:
-        """Search for similar documents."""
-        if not self.is_loaded:
-            print("Index not loaded. Call load_index() first.")
-            return []
-        
-        if not query.strip():
-            return []
-        
-        try:
-            # Encode query
-            query_embedding = self.model.encode([query])
-            faiss.normalize_L2(query_embedding)  # Normalize for cosine similarity
-            
-            # Search in index
-            scores, indices = self.index.search(query_embedding.astype('float32'), top_k)
-            
-            # Prepare results
-            results = []
-            for score, idx in zip(scores[0], indices[0]):
-                if idx != -1 and score > score_threshold:  # -1 indicates no more results
-                    results.append({
-                        "content": self.documents[idx],
-                        "metadata": self.metadata[idx],
-                        "score": float(score)
-                    })
-            
-            return results
-            
-        except Exception as e:
-            print(f"Error during search: {e}")
-            return []
-    
-    def search_by_document_type(self, query: str, doc_type: str, top_k: int = 5, score_threshold: float = 0.1) -> List[Dict[str, Any]]:
-        """Search for similar documents filtered by document type."""
-        all_results = self.search(query, top_k * 2, score_threshold)  # Get more to filter
-        
-        # Filter by document type
-        filtered_results = [
-            result for result in all_results 
-            if result["metadata"].get("doc_type") == doc_type
-        ]
-        
-        return filtered_results[:top_k]
-    
-    def search_by_source(self, query: str, source_pattern: str, top_k: int = 5, score_threshold: float = 0.1) -> List[Dict[str, Any]]:
-        """Search for similar documents filtered by source pattern."""
-        all_results = self.search(query, top_k * 2, score_threshold)
-        
-        # Filter by source pattern (simple contains check)
-        filtered_results = [
-            result for result in all_results 
-            if source_pattern.lower() in result["metadata"].get("source", "").lower()
-        ]
-        
-        return filtered_results[:top_k]
-    
-    def get_document_stats(self) -> Dict[str, Any]:
-        """Get statistics about the indexed documents."""
-        if not self.is_loaded:
-            return {}
-        
-        doc_types = {}
-        sources = {}
-        
-        for meta in self.metadata:
-            doc_type = meta.get("doc_type", "unknown")
-            source = meta.get("file_name", "unknown")
-            
-            doc_types[doc_type] = doc_types.get(doc_type, 0) + 1
-            sources[source] = sources.get(source, 0) + 1
-        
-        return {
-            "total_chunks": len(self.documents),
-            "document_types": doc_types,
-            "sources": sources,
-            "index_dimension": self.index.d if self.index else 0
-        }
-    
-    def get_all_documents_by_type(self, doc_type: str) -> List[Dict[str, Any]]:
-        """Get all documents of a specific type."""
-        if not self.is_loaded:
-            return []
-        
-        results = []
-        for i, meta in enumerate(self.metadata):
-            if meta.get("doc_type") == doc_type:
-                results.append({
-                    "content": self.documents[i],
-                    "metadata": meta,
-                    "index": i
-                })
-        
-        return results
-    
-    def semantic_search_context(self, query: str, context_size: int = 3, top_k: int = 5) -> str:
-        """
-        Perform semantic search and return concatenated context for LLM.
-        Useful for RAG applications.
-        """
-        results = self.search(query, top_k)
-        
-        if not results:
-            return ""
-        
-        # Format results into context string
-        context_parts = []
-        for i, result in enumerate(results):
-            source = result["metadata"].get("file_name", "unknown")
-            doc_type = result["metadata"].get("doc_type", "unknown")
-            content = result["content"]
-            score = result["score"]
-            
-            context_parts.append(
-                f"Document {i+1} (Source: {source}, Type: {doc_type}, Relevance: {score:.3f}):\n"
-                f"{content}\n"
-            )
-        
-        return "\n".join(context_parts)
-    
-    def find_relevant_context(self, queries: List[str], top_k_per_query: int = 3) -> str:
-        """
-        Find relevant context for multiple queries and combine them.
-        Useful when you need context for multiple aspects of a topic.
-        """
-        all_results = []
-        seen_content = set()
-        
-        for query in queries:
-            results = self.search(query, top_k_per_query)
-            for result in results:
-                content = result["content"]
-                if content not in seen_content:
-                    all_results.append(result)
-                    seen_content.add(content)
-        
-        # Sort by score descending
-        all_results.sort(key=lambda x: x["score"], reverse=True)
-        
-        # Format into context
-        if not all_results:
-            return ""
-        
-        context_parts = []
-        for i, result in enumerate(all_results):
-            source = result["metadata"].get("file_name", "unknown")
-            doc_type = result["metadata"].get("doc_type", "unknown")
-            content = result["content"]
-            score = result["score"]
-            
-            context_parts.append(
-                f"Document {i+1} (Source: {source}, Type: {doc_type}, Relevance: {score:.3f}):\n"
-                f"{content}\n"
-            )
-        
-        return "\n".join(context_parts)
-
-
-class RAGSystem:
-    """Combined RAG system for easy use."""
-    
-    def __init__(self, index_path: str, metadata_path: str, model_name: str = "all-MiniLM-L6-v2"):
-        self.retriever = DocumentRetriever(model_name)
-        self.index_path = index_path
-        self.metadata_path = metadata_path
-        self.is_ready = False
-        
-        # Try to load existing index
-        if os.path.exists(index_path) and os.path.exists(metadata_path):
-            self.is_ready = self.retriever.load_index(index_path, metadata_path)
-    
-    def search_for_context(self, query: str, top_k: int = 5) -> str:
-        """Search and return formatted context for LLM."""
-        if not self.is_ready:
-            return "No documents indexed yet."
-        
-        return self.retriever.semantic_search_context(query, top_k=top_k)
-    
-    def multi_query_context(self, queries: List[str], top_k_per_query: int = 3) -> str:
-        """Get context for multiple related queries."""
-        if not self.is_ready:
-            return "No documents indexed yet."
-        
-        return self.retriever.find_relevant_context(queries, top_k_per_query)
-    
-    def get_stats(self) -> Dict[str, Any]:
-        """Get indexing statistics."""
-        if not self.is_ready:
-            return {"status": "not_ready", "message": "No index loaded"}
-        
-        stats = self.retriever.get_document_stats()
-        stats["status"] = "ready"
-        return stats
-
-
-if __name__ == "__main__":
-    # Example usage
-    rag = RAGSystem("../db/faiss_index.bin", "../db/metadata.pkl")
-    
-    if rag.is_ready:
-        # Test search
-        context = rag.search_for_context("startup business model", top_k=3)
-        print("Context found:")
-        print(context)
-        
-        # Multi-query search
-        queries = ["startup funding", "business strategy", "market analysis"]
-        multi_context = rag.multi_query_context(queries, top_k_per_query=2)
-        print("\nMulti-query context:")
-        print(multi_context)
-        
-        # Stats
-        stats = rag.get_stats()
-        print("\nIndex stats:")
-        print(stats)
-    else:
+import os
+import pickle
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
+import faiss
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+
+class _ArrowStringColumn:
+    """Lazy read-only view over an Arrow large_string column.
+    
+    Chunk texts stay in the memory-mapped Arrow buffer and are only
+    materialized as Python strings on access.
+    """
+    
+    def __init__(self, column):
+        self._column = column
+    
+    def __len__(self):
+        return len(self._column)
+    
+    def __getitem__(self, idx):
+        return self._column[int(idx)].as_py()
+    
+    def __iter__(self):
+        return (value.as_py() for value in self._column)
+
+
+class DocumentRetriever:
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+        """Initialize the retriever with sentence transformer model."""
+        self.model = SentenceTransformer(model_name)
+        self.index = None
+        self.documents = []
+        self.metadata = []
+        self.is_loaded = False
+        self._by_type = {}
+        self._type_counts = {}
+        self._source_counts = {}
+        # Per-instance so cached vectors die with the retriever, not the class
+        self._encode_query = lru_cache(maxsize=4096)(self._encode_query_uncached)
+    
+    def _encode_query_uncached(self, query: str) -> bytes:
+        """Encode a single query to normalized float32 bytes.
+        
+        Multi-query flows repeat the same few queries, so search caches this
+        behind an LRU keyed on the lowercased query (~1.5 KB per entry).
+        Bytes are cached instead of arrays to keep entries immutable.
+        """
+        return self.model.encode(
+            [query], normalize_embeddings=True, convert_to_numpy=True
+        ).astype(np.float32, copy=False).tobytes()
+    
+    def load_index(self, index_path: str, metadata_path: str) -> bool:
+        """Load the FAISS index and metadata."""
+        try:
+            if not os.path.exists(index_path) or not os.path.exists(metadata_path):
+                print(f"Index or metadata file not found: {index_path}, {metadata_path}")
+                return False
+            
+            # Load FAISS index; mmap keeps pages shared across gunicorn
+            # workers instead of a private full-RSS copy per process
+            try:
+                self.index = faiss.read_index(
+                    index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                )
+            except RuntimeError:
+                # Flat and HNSW indexes don't support mmapped loads
+                self.index = faiss.read_index(index_path)
+            self._tune_search_params()
+            self._maybe_move_index_to_gpu()
+            
+            # Load metadata (Arrow IPC written by newer indexers, else pickle)
+            with open(metadata_path, 'rb') as f:
+                magic = f.read(6)
+            if magic == b'ARROW1':
+                self._load_metadata_arrow(metadata_path)
+            else:
+                with open(metadata_path, 'rb') as f:
+                    data = pickle.load(f)
+                    self.documents = data['documents']
+                    self.metadata = data['metadata']
+            
+            self._build_type_index()
+            
+            self.is_loaded = True
+            print(f"Loaded index with {len(self.documents)} documents")
+            return True
+            
+        except Exception as e:
+            print(f"Error loading index: {e}")
+            return False
+    
+    def _load_metadata_arrow(self, metadata_path: str):
+        """Load documents and metadata from a memory-mapped Arrow file."""
+        import pyarrow as pa
+        
+        with pa.memory_map(metadata_path, 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+        
+        # Text stays lazy in the mapped buffer; metadata dicts are small and
+        # accessed constantly, so they are hydrated up front (dropping the
+        # nulls that Arrow adds when unioning per-doc-type schemas)
+        self.documents = _ArrowStringColumn(table.column('content').combine_chunks())
+        self.metadata = [
+            {k: v for k, v in row.items() if v is not None}
+            for row in table.column('metadata').to_pylist()
+        ]
+    
+    def _build_type_index(self):
+        """Precompute doc_type -> row-id posting lists and count maps.
+        
+        Built once at load time so the filtered-search and stats methods
+        don't walk the whole metadata list on every call.
+        """
+        by_type = {}
+        type_counts = {}
+        source_counts = {}
+        
+        for i, meta in enumerate(self.metadata):
+            doc_type = meta.get("doc_type", "unknown")
+            source = meta.get("file_name", "unknown")
+            by_type.setdefault(doc_type, []).append(i)
+            type_counts[doc_type] = type_counts.get(doc_type, 0) + 1
+            source_counts[source] = source_counts.get(source, 0) + 1
+        
+        self._by_type = {t: np.asarray(ids, dtype=np.int64) for t, ids in by_type.items()}
+        self._type_counts = type_counts
+        self._source_counts = source_counts
+    
+    def _maybe_move_index_to_gpu(self):
+        """Move the loaded index to GPU 0 when a CUDA FAISS build is present.
+        
+        On GPU the inner-product scan becomes a single batched matmul; with
+        the CPU-only faiss build get_num_gpus is absent and this is a no-op.
+        """
+        if getattr(faiss, "get_num_gpus", lambda: 0)() <= 0:
+            return
+        try:
+            self._gpu_resources = faiss.StandardGpuResources()
+            self.index = faiss.index_cpu_to_gpu(self._gpu_resources, 0, self.index)
+            print("FAISS index moved to GPU")
+        except Exception as e:
+            print(f"Keeping FAISS index on CPU: {e}")
+    
+    def _tune_search_params(self):
+        """Set search-time knobs for ANN index types; flat indexes have none."""
+        if hasattr(self.index, "nprobe"):
+            self.index.nprobe = 16
+        if hasattr(self.index, "hnsw"):
+            self.index.hnsw.efSearch = 64
+    
+    def search(self, query: str, top_k: int = 5, score_threshold: float = 0.1) -> List[Dict[str, Any]]:
+        """Search for similar documents."""
+        if not self.is_loaded:
+            print("Index not loaded. Call load_index() first.")
+            return []
+        
+        if not query.strip():
+            return []
+        
+        try:
+            # Encode query (normalized in-model, cached for repeat queries)
+            query_embedding = np.frombuffer(
+                self._encode_query(query.strip().lower()), dtype=np.float32
+            ).reshape(1, -1)
+            
+            # Search in index
+            scores, indices = self.index.search(query_embedding, top_k)
+            
+            # Prepare results
+            results = []
+            for score, idx in zip(scores[0], indices[0]):
+                if idx != -1 and score > score_threshold:  # -1 indicates no more results
+                    results.append({
+                        "content": self.documents[idx],
+                        "metadata": self.metadata[idx],
+                        "score": float(score)
+                    })
+            
+            return results
+            
+        except Exception as e:
+            print(f"Error during search: {e}")
+            return []
+    
+    def search_batch(self, queries: List[str], top_k: int = 5, score_threshold: float = 0.1) -> List[List[Dict[str, Any]]]:
+        """Search several queries with one encode and one FAISS call.
+        
+        Encoding queries one at a time runs the transformer at batch size 1;
+        batching them amortizes the forward pass, and FAISS search is already
+        batched across rows. Returns one result list per query, in order.
+        """
+        if not self.is_loaded:
+            print("Index not loaded. Call load_index() first.")
+            return [[] for _ in queries]
+        
+        valid = [(i, q) for i, q in enumerate(queries) if q.strip()]
+        results_per_query = [[] for _ in queries]
+        if not valid:
+            return results_per_query
+        
+        try:
+            embeddings = self.model.encode(
+                [q for _, q in valid],
+                batch_size=len(valid),
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            ).astype('float32', copy=False)
+            
+            scores, indices = self.index.search(embeddings, top_k)
+            
+            for (query_pos, _), row_scores, row_indices in zip(valid, scores, indices):
+                results = []
+                for score, idx in zip(row_scores, row_indices):
+                    if idx != -1 and score > score_threshold:
+                        results.append({
+                            "content": self.documents[idx],
+                            "metadata": self.metadata[idx],
+                            "score": float(score)
+                        })
+                results_per_query[query_pos] = results
+            
+            return results_per_query
+            
+        except Exception as e:
+            print(f"Error during batch search: {e}")
+            return [[] for _ in queries]
+    
+    def search_by_document_type(self, query: str, doc_type: str, top_k: int = 5, score_threshold: float = 0.1) -> List[Dict[str, Any]]:
+        """Search for similar documents filtered by document type."""
+        if not self.is_loaded:
+            return []
+        
+        ids = self._by_type.get(doc_type)
+        if ids is None or not len(ids):
+            return []
+        
+        # True filtered search: FAISS only scores rows of the requested type,
+        # instead of over-fetching top_k*2 results and post-filtering
+        try:
+            query_embedding = np.frombuffer(
+                self._encode_query(query.strip().lower()), dtype=np.float32
+            ).reshape(1, -1)
+            
+            selector = faiss.IDSelectorBatch(ids)
+            if hasattr(self.index, "nprobe"):
+                params = faiss.SearchParametersIVF(sel=selector, nprobe=self.index.nprobe)
+            elif hasattr(self.index, "hnsw"):
+                params = faiss.SearchParametersHNSW(sel=selector)
+            else:
+                params = faiss.SearchParameters(sel=selector)
+            
+            scores, indices = self.index.search(
+                query_embedding, min(top_k, len(ids)), params=params
+            )
+            
+            results = []
+            for score, idx in zip(scores[0], indices[0]):
+                if idx != -1 and score > score_threshold:
+                    results.append({
+                        "content": self.documents[idx],
+                        "metadata": self.metadata[idx],
+                        "score": float(score)
+                    })
+            return results
+            
+        except Exception:
+            # Older FAISS builds without ID selectors: over-fetch and filter
+            all_results = self.search(query, top_k * 2, score_threshold)
+            filtered_results = [
+                result for result in all_results 
+                if result["metadata"].get("doc_type") == doc_type
+            ]
+            return filtered_results[:top_k]
+    
+    def search_by_source(self, query: str, source_pattern: str, top_k: int = 5, score_threshold: float = 0.1) -> List[Dict[str, Any]]:
+        """Search for similar documents filtered by source pattern."""
+        all_results = self.search(query, top_k * 2, score_threshold)
+        
+        # Filter by source pattern (simple contains check)
+        filtered_results = [
+            result for result in all_results 
+            if source_pattern.lower() in result["metadata"].get("source", "").lower()
+        ]
+        
+        return filtered_results[:top_k]
+    
+    def get_document_stats(self) -> Dict[str, Any]:
+        """Get statistics about the indexed documents."""
+        if not self.is_loaded:
+            return {}
+        
+        # Counts were precomputed when the index loaded
+        return {
+            "total_chunks": len(self.documents),
+            "document_types": dict(self._type_counts),
+            "sources": dict(self._source_counts),
+            "index_dimension": self.index.d if self.index else 0
+        }
+    
+    def get_all_documents_by_type(self, doc_type: str) -> List[Dict[str, Any]]:
+        """Get all documents of a specific type."""
+        if not self.is_loaded:
+            return []
+        
+        return [
+            {
+                "content": self.documents[i],
+                "metadata": self.metadata[i],
+                "index": int(i)
+            }
+            for i in self._by_type.get(doc_type, ())
+        ]
+    
+    def semantic_search_context(self, query: str, context_size: int = 3, top_k: int = 5) -> str:
+        """
+        Perform semantic search and return concatenated context for LLM.
+        Useful for RAG applications.
+        """
+        results = self.search(query, top_k)
+        
+        if not results:
+            return ""
+        
+        # Format results into context string
+        context_parts = []
+        for i, result in enumerate(results):
+            source = result["metadata"].get("file_name", "unknown")
+            doc_type = result["metadata"].get("doc_type", "unknown")
+            content = result["content"]
+            score = result["score"]
+            
+            context_parts.append(
+                f"Document {i+1} (Source: {source}, Type: {doc_type}, Relevance: {score:.3f}):\n"
+                f"{content}\n"
+            )
+        
+        return "\n".join(context_parts)
+    
+    def find_relevant_context(self, queries: List[str], top_k_per_query: int = 3) -> str:
+        """
+        Find relevant context for multiple queries and combine them.
+        Useful when you need context for multiple aspects of a topic.
+        """
+        valid = [q for q in queries if q.strip()]
+        if not self.is_loaded or not valid:
+            return ""
+
+        # One encode and one FAISS call for all queries
+        results_per_query = self.search_batch(valid, top_k=top_k_per_query)
+
+        # Flatten best-first, keeping one hit per index row. The metadata
+        # dicts are per-row singletons, so their identity stands in for the
+        # row id without hashing full chunk texts.
+        seen_rows = set()
+        all_results = []
+        for result in sorted(
+            (r for results in results_per_query for r in results),
+            key=lambda r: -r["score"]
+        ):
+            row_key = id(result["metadata"])
+            if row_key not in seen_rows:
+                seen_rows.add(row_key)
+                all_results.append(result)
+
+        # Format into context
+        if not all_results:
+            return ""
+        
+        context_parts = []
+        for i, result in enumerate(all_results):
+            source = result["metadata"].get("file_name", "unknown")
+            doc_type = result["metadata"].get("doc_type", "unknown")
+            content = result["content"]
+            score = result["score"]
+            
+            context_parts.append(
+                f"Document {i+1} (Source: {source}, Type: {doc_type}, Relevance: {score:.3f}):\n"
+                f"{content}\n"
+            )
+        
+        return "\n".join(context_parts)
+
+
+class RAGSystem:
+    """Combined RAG system for easy use."""
+    
+    def __init__(self, index_path: str, metadata_path: str, model_name: str = "all-MiniLM-L6-v2"):
+        self.retriever = DocumentRetriever(model_name)
+        self.index_path = index_path
+        self.metadata_path = metadata_path
+        self.is_ready = False
+        
+        # Try to load existing index
+        if os.path.exists(index_path) and os.path.exists(metadata_path):
+            self.is_ready = self.retriever.load_index(index_path, metadata_path)
+
+    @classmethod
+    def from_indexer(cls, indexer) -> "RAGSystem":
+        """Build a ready RAGSystem around a live DocumentIndexer.
+
+        Reuses the indexer's FAISS index, model and metadata in place —
+        no read_index, no model reload — so e.g. verifying a freshly
+        built index costs no extra I/O or memory.
+        """
+        retriever = DocumentRetriever.__new__(DocumentRetriever)
+        retriever.model = indexer.model
+        retriever.index = indexer.index
+        retriever.documents = indexer.documents
+        retriever.metadata = indexer.metadata
+        retriever._encode_query = lru_cache(maxsize=4096)(retriever._encode_query_uncached)
+        retriever._build_type_index()
+        retriever._tune_search_params()
+        retriever.is_loaded = indexer.index is not None
+
+        system = cls.__new__(cls)
+        system.retriever = retriever
+        system.index_path = None
+        system.metadata_path = None
+        system.is_ready = retriever.is_loaded
+        return system
+
+    def search_for_context(self, query: str, top_k: int = 5) -> str:
+        """Search and return formatted context for LLM."""
+        if not self.is_ready:
+            return "No documents indexed yet."
+        
+        return self.retriever.semantic_search_context(query, top_k=top_k)
+    
+    def multi_query_context(self, queries: List[str], top_k_per_query: int = 3) -> str:
+        """Get context for multiple related queries."""
+        if not self.is_ready:
+            return "No documents indexed yet."
+        
+        return self.retriever.find_relevant_context(queries, top_k_per_query)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get indexing statistics."""
+        if not self.is_ready:
+            return {"status": "not_ready", "message": "No index loaded"}
+        
+        stats = self.retriever.get_document_stats()
+        stats["status"] = "ready"
+        return stats
+
+
+if __name__ == "__main__":
+    # Example usage
+    rag = RAGSystem("../db/faiss_index.bin", "../db/metadata.pkl")
+    
+    if rag.is_ready:
+        # Test search
+        context = rag.search_for_context("startup business model", top_k=3)
+        print("Context found:")
+        print(context)
+        
+        # Multi-query search
+        queries = ["startup funding", "business strategy", "market analysis"]
+        multi_context = rag.multi_query_context(queries, top_k_per_query=2)
+        print("\nMulti-query context:")
+        print(multi_context)
+        
+        # Stats
+        stats = rag.get_stats()
+        print("\nIndex stats:")
+        print(stats)
+    else:
         print("RAG system not ready. Build index first.")
\ No newline at end of file
@@ -1,415 +1,600 @@
-"""
-Utility functions and helper classes for the Optimizer system.
-
-This module provides common utilities used across different components
-of the Optimizer application.
-"""
-
-import os
-import json
-import time
-import hashlib
-import logging
-from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Union
-from pathlib import Path
-import re
-
-
-class Logger:
-    """Simple logging utility for the Optimizer system."""
-    
-    def __init__(self, name: str, level: int = logging.INFO):
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(level)
-        
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-    
-    def info(self, message: str):
-        self.logger.info(message)
-    
-    def error(self, message: str):
-        self.logger.error(message)
-    
-    def warning(self, message: str):
-        self.logger.warning(message)
-    
-    def debug(self, message: str):
-        self.logger.debug(message)
-
-
-class ConfigManager:
-    """Configuration manager for the Optimizer system."""
-    
-    def __init__(self, config_file: str = ".env"):
-        self.config_file = config_file
-        self.config = {}
-        self.load_config()
-    
-    def load_config(self):
-        """Load configuration from environment and .env file."""
-        # Load from .env file if it exists
-        if os.path.exists(self.config_file):
-            with open(self.config_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        self.config[key.strip()] = value.strip().strip('"\'')
-        
-        # Override with environment variables
-        self.config.update(os.environ)
-    
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value."""
-        return self.config.get(key, default)
-    
-    def get_required(self, key: str) -> str:
-        """Get required configuration value, raise error if missing."""
-        value = self.config.get(key)
-        if value is None:
-            raise ValueError(f"Required configuration key '{key}' is missing")
-        return value
-    
-    def get_api_keys(self) -> Dict[str, str]:
-        """Get all Gemini API keys."""
-        keys = {}
-        for i in range(1, 6):  # GEMINI_API_KEY_1 through GEMINI_API_KEY_5
-            key_name = f"GEMINI_API_KEY_{i}"
-            key_value = self.get(key_name)
-            if key_value:
-                keys[key_name] = key_value
-        
-        serpapi_key = self.get("SERPAPI_KEY")
-        if serpapi_key:
-            keys["SERPAPI_KEY"] = serpapi_key
-        
-        return keys
-
-
-class TextProcessor:
-    """Text processing utilities."""
-    
-    @staticmethod
-    def clean_text(text: str) -> str:
-        """Clean and normalize text."""
-        if not text:
-            return ""
-        
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # Remove special characters that might cause issues
-        text = re.sub(r'[^\w\s\-.,!?;:()\'"]+', '', text)
-        
-        return text
-    
-    @staticmethod
-    def truncate_text(text: str, max_length: int = 2000, suffix: str = "...") -> str:
-        """Truncate text to maximum length."""
-        if len(text) <= max_length:
-            return text
-        
-        return text[:max_length - len(suffix)] + suffix
-    
-    @staticmethod
-    def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
-        """Extract keywords from text (simple implementation)."""
-        # Remove common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'
-        }
-        
-        # Extract words
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-        
-        # Filter out stop words and count frequency
-        word_freq = {}
-        for word in words:
-            if word not in stop_words:
-                word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # Sort by frequency and return top keywords
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, freq in sorted_words[:max_keywords]]
-    
-    @staticmethod
-    def format_markdown(text: str) -> str:
-        """Basic markdown formatting."""
-        if not text:
-            return ""
-        
-        # Convert headers
-        text = re.sub(r'^# (.+)$', r'<h1>\1</h1>', text, flags=re.MULTILINE)
-        text = re.sub(r'^## (.+)$', r'<h2>\1</h2>', text, flags=re.MULTILINE)
-        text = re.sub(r'^### (.+)$', r'<h3>\1</h3>', text, flags=re.MULTILINE)
-        
-        # Convert bold and italic
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-        text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
-        
-        # Convert line breaks
-        text = text.replace('\n', '<br>')
-        
-        return text
-
-
-class FileUtils:
-    """File and path utilities."""
-    
-    @staticmethod
-    def ensure_directory(path: str) -> bool:
-        """Ensure directory exists, create if it doesn't."""
-        try:
-            os.makedirs(path, exist_ok=True)
-            return True
-        except Exception as e:
-            logging.error(f"Failed to create directory {path}: {e}")
-            return False
-    
-    @staticmethod
-    def safe_filename(filename: str) -> str:
-        """Convert filename to safe format."""
-        # Remove or replace unsafe characters
-        safe_name = re.sub(r'[^\w\-_.]', '_', filename)
-        # Limit length
-        if len(safe_name) > 255:
-            name, ext = os.path.splitext(safe_name)
-            safe_name = name[:255-len(ext)] + ext
-        return safe_name
-    
-    @staticmethod
-    def get_file_hash(filepath: str) -> Optional[str]:
-        """Get MD5 hash of file."""
-        try:
-            hash_md5 = hashlib.md5()
-            with open(filepath, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
-        except Exception as e:
-            logging.error(f"Failed to hash file {filepath}: {e}")
-            return None
-    
-    @staticmethod
-    def get_file_info(filepath: str) -> Dict[str, Any]:
-        """Get comprehensive file information."""
-        try:
-            path = Path(filepath)
-            stat = path.stat()
-            
-            return {
-                "name": path.name,
-                "size": stat.st_size,
-                "modified": datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat(),
-                "extension": path.suffix,
-                "exists": path.exists(),
-                "is_file": path.is_file(),
-                "hash": FileUtils.get_file_hash(filepath) if path.exists() else None
-            }
-        except Exception as e:
-            logging.error(f"Failed to get file info for {filepath}: {e}")
-            return {"exists": False, "error": str(e)}
-
-
-class DataValidator:
-    """Data validation utilities."""
-    
-    @staticmethod
-    def validate_project_data(data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate project data structure."""
-        errors = []
-        warnings = []
-        
-        # Required fields
-        required_fields = ['project_data']
-        for field in required_fields:
-            if not data.get(field):
-                errors.append(f"Missing required field: {field}")
-        
-        # Project data content validation
-        project_text = data.get('project_data', '')
-        if len(project_text.strip()) < 100:
-            warnings.append("Project description is quite short - more detail would improve analysis")
-        
-        if len(project_text) > 50000:
-            warnings.append("Project description is very long - consider summarizing key points")
-        
-        # Team info validation
-        team_info = data.get('team_info', '')
-        if not team_info and len(project_text) > 1000:
-            warnings.append("Team information not provided - this could help with analysis")
-        
-        # Files validation
-        files = data.get('files', [])
-        if len(files) > 10:
-            warnings.append("Many files uploaded - processing might take longer")
-        
-        return {
-            "valid": len(errors) == 0,
-            "errors": errors,
-            "warnings": warnings
-        }
-    
-    @staticmethod
-    def validate_api_keys(keys: Dict[str, str]) -> Dict[str, Any]:
-        """Validate API keys structure."""
-        errors = []
-        warnings = []
-        
-        # Check required Gemini keys
-        required_gemini_keys = [f"GEMINI_API_KEY_{i}" for i in range(1, 6)]
-        for key in required_gemini_keys:
-            if not keys.get(key):
-                errors.append(f"Missing API key: {key}")
-            elif len(keys[key]) < 20:
-                warnings.append(f"API key {key} seems too short")
-        
-        # Check SerpAPI key
-        if not keys.get("SERPAPI_KEY"):
-            errors.append("Missing SERPAPI_KEY")
-        elif len(keys["SERPAPI_KEY"]) < 20:
-            warnings.append("SERPAPI_KEY seems too short")
-        
-        return {
-            "valid": len(errors) == 0,
-            "errors": errors,
-            "warnings": warnings,
-            "keys_count": len([k for k in keys.values() if k])
-        }
-
-
-class PerformanceTimer:
-    """Simple performance timing utility."""
-    
-    def __init__(self, name: str = "Operation"):
-        self.name = name
-        self.start_time = None
-        self.end_time = None
-    
-    def __enter__(self):
-        self.start_time = time.time()
-        return self
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = time.time()
-        duration = self.end_time - self.start_time
-        print(f"⏱️ {self.name} completed in {duration:.2f} seconds")
-    
-    def elapsed(self) -> float:
-        """Get elapsed time in seconds."""
-        if self.start_time is None:
-            return 0.0
-        end = self.end_time or time.time()
-        return end - self.start_time
-
-
-class ResponseFormatter:
-    """Utilities for formatting API responses."""
-    
-    @staticmethod
-    def success_response(data: Any, message: str = "Success") -> Dict[str, Any]:
-        """Create successful API response."""
-        return {
-            "status": "success",
-            "message": message,
-            "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
-    
-    @staticmethod
-    def error_response(error: str, code: int = 500, details: Any = None) -> Dict[str, Any]:
-        """Create error API response."""
-        response = {
-            "status": "error",
-            "error": error,
-            "code": code,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
-        
-        if details:
-            response["details"] = details
-        
-        return response
-    
-    @staticmethod
-    def format_agent_result(result: Dict[str, Any], agent_name: str) -> Dict[str, Any]:
-        """Format agent result for consistent API response."""
-        formatted = {
-            "agent": agent_name,
-            "status": result.get("status", "unknown"),
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
-        
-        # Add data based on status
-        if result.get("status") == "success":
-            # Remove status from data to avoid duplication
-            data = {k: v for k, v in result.items() if k != "status"}
-            formatted["data"] = data
-        else:
-            formatted["error"] = result.get("error", "Unknown error")
-        
-        return formatted
-
-
-# Convenience functions
-def get_logger(name: str) -> Logger:
-    """Get logger instance."""
-    return Logger(name)
-
-
-def load_config(config_file: str = ".env") -> ConfigManager:
-    """Load configuration."""
-    return ConfigManager(config_file)
-
-
-def time_operation(name: str):
-    """Decorator for timing operations."""
-    def decorator(func):
-        def wrapper(*args, **kwargs):
-            with PerformanceTimer(name):
-                return func(*args, **kwargs)
-        return wrapper
-    return decorator
-
-
-# Example usage and testing
-if __name__ == "__main__":
-    # Test configuration manager
-    config = load_config()
-    print("🔧 Configuration loaded")
-    
-    # Test text processing
-    processor = TextProcessor()
-    sample_text = "This is a **sample** text with *formatting* and keywords about startup business model."
-    
-    keywords = processor.extract_keywords(sample_text)
-    print(f"📝 Keywords: {keywords}")
-    
-    cleaned = processor.clean_text(sample_text)
-    print(f"🧹 Cleaned text: {cleaned}")
-    
-    # Test validation
-    validator = DataValidator()
-    test_data = {
-        "project_data": "A mobile app for restaurants",
-        "team_info": "Small technical team"
-    }
-    
-    validation = validator.validate_project_data(test_data)
-    print(f"✅ Validation result: {validation}")
-    
-    # Test performance timer
-    with PerformanceTimer("Sample operation"):
-        time.sleep(0.1)  # Simulate work
-    
+"""
+Utility functions and helper classes for the Optimizer system.
+
+This module provides common utilities used across different components
+of the Optimizer application.
+"""
+
+import os
+import json
+import mmap
+import stat
+import time
+import hashlib
+import logging
+from collections import ChainMap, Counter
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Union
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Compiled once at import so hot helpers skip the re module's per-call
+# pattern-cache lookup (and recompilation when that cache is evicted)
+# Whitespace runs and disallowed characters matched in one alternation so
+# cleaning walks the string once; group 1 decides the replacement
+_CLEAN_RE = re.compile(r'(\s+)|[^\w\s\-.,!?;:()\'"]+')
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+# Markdown constructs in one alternation so formatting is a single scan
+# instead of five re.sub passes plus a str.replace
+_MD_RE = re.compile(r'^(#{1,3}) (.+)$|\*\*(.+?)\*\*|\*(.+?)\*|\n', re.MULTILINE)
+_MD_INLINE_RE = re.compile(r'\*\*(.+?)\*\*|\*(.+?)\*')
+
+
+def _md_inline(match):
+    bold, italic = match.group(1, 2)
+    if bold is not None:
+        return f'<strong>{bold}</strong>'
+    return f'<em>{italic}</em>'
+
+
+def _md_replace(match):
+    hashes, header, bold, italic = match.group(1, 2, 3, 4)
+    if hashes:
+        level = len(hashes)
+        return f'<h{level}>{_MD_INLINE_RE.sub(_md_inline, header)}</h{level}>'
+    if bold is not None:
+        return f'<strong>{bold}</strong>'
+    if italic is not None:
+        return f'<em>{italic}</em>'
+    return '<br>'
+
+# Required Gemini key names, fixed at import instead of rebuilt per check
+_REQUIRED_GEMINI = tuple(f"GEMINI_API_KEY_{i}" for i in range(1, 6))
+
+# Frozen so membership hashes are computed once at import
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'
+})
+
+# 64-bit Bloom-style mask over the stop words: a clear bit proves a word
+# is not a stop word with one integer AND, so the common (non-stop) case
+# skips the set probe; set bits still confirm against the real set
+_STOP_MASK = 0
+for _word in _STOP_WORDS:
+    _STOP_MASK |= 1 << (hash(_word) & 63)
+del _word
+
+
+class Logger:
+    """Simple logging utility for the Optimizer system."""
+    
+    def __init__(self, name: str, level: int = logging.INFO):
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(level)
+        
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+    
+    def info(self, message: str):
+        self.logger.info(message)
+    
+    def error(self, message: str):
+        self.logger.error(message)
+    
+    def warning(self, message: str):
+        self.logger.warning(message)
+    
+    def debug(self, message: str):
+        self.logger.debug(message)
+
+
+# Parsed .env contents keyed by (abspath, mtime); every agent constructs
+# its own ConfigManager, so the file is parsed once per edit, not per use
+_CONFIG_CACHE: Dict[tuple, Dict[str, str]] = {}
+
+
+class ConfigManager:
+    """Configuration manager for the Optimizer system."""
+    
+    def __init__(self, config_file: str = ".env"):
+        self.config_file = config_file
+        self.config = {}
+        self._api_keys_cache = None
+        self.load_config()
+    
+    def load_config(self):
+        """Load configuration from environment and .env file."""
+        # Load from .env file if it exists (cached until the file changes)
+        parsed = {}
+        if os.path.exists(self.config_file):
+            cache_key = (os.path.abspath(self.config_file),
+                         os.path.getmtime(self.config_file))
+            parsed = _CONFIG_CACHE.get(cache_key)
+            if parsed is None:
+                parsed = {}
+                with open(self.config_file, 'r') as f:
+                    for raw in f:
+                        line = raw.strip()
+                        if not line or line[0] == '#' or '=' not in line:
+                            continue
+                        # partition is one C call, no intermediate list
+                        key, _, value = line.partition('=')
+                        parsed[key.rstrip()] = value.lstrip().strip('"\'')
+                _CONFIG_CACHE[cache_key] = parsed
+        
+        # Environment variables win; ChainMap layers them live over the
+        # parsed file without copying the whole environment per instance
+        self.config = ChainMap(os.environ, parsed)
+        self._api_keys_cache = None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get configuration value."""
+        return self.config.get(key, default)
+    
+    def get_required(self, key: str) -> str:
+        """Get required configuration value, raise error if missing."""
+        value = self.config.get(key)
+        if value is None:
+            raise ValueError(f"Required configuration key '{key}' is missing")
+        return value
+    
+    def get_api_keys(self) -> Dict[str, str]:
+        """Get all Gemini API keys."""
+        # Agents call this repeatedly per analysis; the key set only changes
+        # when load_config runs, which clears the cache
+        if self._api_keys_cache is not None:
+            return dict(self._api_keys_cache)
+        
+        keys = {}
+        for i in range(1, 6):  # GEMINI_API_KEY_1 through GEMINI_API_KEY_5
+            key_name = f"GEMINI_API_KEY_{i}"
+            key_value = self.get(key_name)
+            if key_value:
+                keys[key_name] = key_value
+        
+        serpapi_key = self.get("SERPAPI_KEY")
+        if serpapi_key:
+            keys["SERPAPI_KEY"] = serpapi_key
+        
+        self._api_keys_cache = keys
+        return dict(keys)
+
+
+# Cached free functions backing TextProcessor; agents routinely push the
+# same project text through these several times per analysis, so repeat
+# calls become a dict lookup. Bounded caches keep memory flat.
+@lru_cache(maxsize=256)
+def _clean_text_cached(text: str) -> str:
+    # Collapse whitespace and strip special characters in a single pass
+    return _CLEAN_RE.sub(lambda m: ' ' if m.group(1) else '', text.strip())
+
+
+@lru_cache(maxsize=256)
+def _extract_keywords_cached(text: str, max_keywords: int) -> tuple:
+    # Count non-stop-words in C and take the top-k via Counter's
+    # heap-based partial sort instead of sorting the whole frequency map
+    words = _WORD_RE.findall(text.lower())
+    counts = Counter(
+        word for word in words
+        if not (_STOP_MASK >> (hash(word) & 63)) & 1 or word not in _STOP_WORDS
+    )
+    return tuple(word for word, _ in counts.most_common(max_keywords))
+
+
+class TextProcessor:
+    """Text processing utilities."""
+    
+    @staticmethod
+    def clean_text(text: str) -> str:
+        """Clean and normalize text."""
+        if not text:
+            return ""
+        
+        return _clean_text_cached(text)
+    
+    @staticmethod
+    def truncate_text(text: str, max_length: int = 2000, suffix: str = "...",
+                      _default_slen: int = len("...")) -> str:
+        """Truncate text to maximum length."""
+        if len(text) <= max_length:
+            return text
+        
+        # Suffix length is baked in as a default for the common "..." case
+        slen = _default_slen if suffix == "..." else len(suffix)
+        return text[:max_length - slen] + suffix
+    
+    @staticmethod
+    def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
+        """Extract keywords from text (simple implementation)."""
+        # Tuples in the cache, a fresh list out so callers can't mutate it
+        return list(_extract_keywords_cached(text, max_keywords))
+    
+    @staticmethod
+    def format_markdown(text: str) -> str:
+        """Basic markdown formatting."""
+        if not text:
+            return ""
+        
+        # Headers, bold, italic and line breaks converted in one pass
+        return _MD_RE.sub(_md_replace, text)
+
+
+@dataclass(slots=True)
+class FileInfo:
+    """File information record; fixed slots instead of a per-file dict."""
+    
+    name: str = ""
+    size: int = 0
+    modified: str = ""
+    extension: str = ""
+    exists: bool = False
+    is_file: bool = False
+    hash: Optional[str] = None
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for JSON responses."""
+        return asdict(self)
+
+
+class _SafeCharTable(dict):
+    """Memoizing str.translate table for safe_filename.
+    
+    Keeps word characters plus '-', '_', '.'; everything else becomes '_'.
+    Each codepoint is classified once, then translate runs entirely in C.
+    """
+    
+    def __missing__(self, code):
+        char = chr(code)
+        safe = char if (char.isalnum() or char in '-_.') else '_'
+        self[code] = safe
+        return safe
+
+
+_SAFE_TABLE = _SafeCharTable()
+
+
+class FileUtils:
+    """File and path utilities."""
+    
+    @staticmethod
+    def ensure_directory(path: str) -> bool:
+        """Ensure directory exists, create if it doesn't."""
+        try:
+            os.makedirs(path, exist_ok=True)
+            return True
+        except Exception as e:
+            logging.error(f"Failed to create directory {path}: {e}")
+            return False
+    
+    @staticmethod
+    def safe_filename(filename: str) -> str:
+        """Convert filename to safe format."""
+        # Remove or replace unsafe characters
+        safe_name = filename.translate(_SAFE_TABLE)
+        # Limit length
+        if len(safe_name) > 255:
+            name, ext = os.path.splitext(safe_name)
+            safe_name = name[:255-len(ext)] + ext
+        return safe_name
+    
+    @staticmethod
+    def get_file_hash(filepath: str) -> Optional[str]:
+        """Get BLAKE2b fingerprint of file (32 hex chars, like MD5)."""
+        try:
+            # BLAKE2b is 2-3x faster than MD5 on 64-bit CPUs; digest_size=16
+            # keeps the same 32-char hex output the callers already store
+            digest = hashlib.blake2b(digest_size=16)
+            with open(filepath, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > 16 << 20:
+                    # Large files: hand the whole mapping to hashlib so the
+                    # bytes are walked in one C call straight from page cache
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        digest.update(mm)
+                elif hasattr(hashlib, "file_digest"):
+                    # Python 3.11+: the read loop runs in C
+                    digest = hashlib.file_digest(
+                        f, lambda: hashlib.blake2b(digest_size=16)
+                    )
+                else:
+                    # 1 MiB chunks: ~256x fewer read/update round trips than
+                    # the old 4 KiB loop, which was interpreter-overhead bound
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(chunk)
+            return digest.hexdigest()
+        except Exception as e:
+            logging.error(f"Failed to hash file {filepath}: {e}")
+            return None
+    
+    @staticmethod
+    def get_file_info(filepath: str) -> FileInfo:
+        """Get comprehensive file information."""
+        try:
+            # One stat call answers existence, type, size and mtime; the old
+            # Path-based version re-statted for exists() and is_file()
+            st = os.stat(filepath)
+            is_file = stat.S_ISREG(st.st_mode)
+            
+            return FileInfo(
+                name=os.path.basename(filepath),
+                size=st.st_size,
+                modified=datetime.fromtimestamp(st.st_mtime, timezone.utc).isoformat(),
+                extension=os.path.splitext(filepath)[1],
+                exists=True,
+                is_file=is_file,
+                hash=FileUtils.get_file_hash(filepath) if is_file else None
+            )
+        except Exception as e:
+            logging.error(f"Failed to get file info for {filepath}: {e}")
+            return FileInfo(error=str(e))
+
+
+class DataValidator:
+    """Data validation utilities."""
+    
+    @staticmethod
+    def validate_project_data(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate project data structure."""
+        errors = []
+        warnings = []
+        
+        # Required fields
+        required_fields = ['project_data']
+        for field in required_fields:
+            if not data.get(field):
+                errors.append(f"Missing required field: {field}")
+        
+        # Project data content validation; lengths computed once and the
+        # stripped copy only made when the raw length could be under 100
+        project_text = data.get('project_data', '')
+        text_len = len(project_text)
+        if text_len < 100 or len(project_text.strip()) < 100:
+            warnings.append("Project description is quite short - more detail would improve analysis")
+        
+        if text_len > 50000:
+            warnings.append("Project description is very long - consider summarizing key points")
+        
+        # Team info validation
+        team_info = data.get('team_info', '')
+        if not team_info and text_len > 1000:
+            warnings.append("Team information not provided - this could help with analysis")
+        
+        # Files validation
+        files = data.get('files', [])
+        if len(files) > 10:
+            warnings.append("Many files uploaded - processing might take longer")
+        
+        return {
+            "valid": len(errors) == 0,
+            "errors": errors,
+            "warnings": warnings
+        }
+    
+    @staticmethod
+    def validate_api_keys(keys: Dict[str, str]) -> Dict[str, Any]:
+        """Validate API keys structure."""
+        errors = []
+        warnings = []
+        
+        # Check required Gemini keys, counting present ones along the way
+        present = 0
+        for key in _REQUIRED_GEMINI:
+            value = keys.get(key)
+            if not value:
+                errors.append(f"Missing API key: {key}")
+                continue
+            present += 1
+            if len(value) < 20:
+                warnings.append(f"API key {key} seems too short")
+        
+        # Check SerpAPI key
+        serpapi = keys.get("SERPAPI_KEY")
+        if not serpapi:
+            errors.append("Missing SERPAPI_KEY")
+        else:
+            present += 1
+            if len(serpapi) < 20:
+                warnings.append("SERPAPI_KEY seems too short")
+        
+        return {
+            "valid": len(errors) == 0,
+            "errors": errors,
+            "warnings": warnings,
+            "keys_count": present
+        }
+
+
+class PerformanceTimer:
+    """Simple performance timing utility."""
+    
+    def __init__(self, name: str = "Operation"):
+        self.name = name
+        self.start_ns = None
+        self.end_ns = None
+    
+    def __enter__(self):
+        # Monotonic integer clock: immune to NTP jumps, no float math
+        # until a human-readable duration is actually needed
+        self.start_ns = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.end_ns = time.perf_counter_ns()
+        duration = (self.end_ns - self.start_ns) / 1e9
+        logging.info(f"⏱️ {self.name} completed in {duration:.2f} seconds")
+    
+    def elapsed(self) -> float:
+        """Get elapsed time in seconds."""
+        if self.start_ns is None:
+            return 0.0
+        end = self.end_ns or time.perf_counter_ns()
+        return (end - self.start_ns) / 1e9
+
+
+class _LazyISO:
+    """Timestamp placeholder that formats itself only when rendered.
+    
+    Agent result dicts are often built in bulk and some are discarded on
+    error paths; storing this sentinel defers the datetime work to the
+    moment the dict is actually serialized (str() or ResponseJSONEncoder).
+    """
+    
+    __slots__ = ()
+    
+    def __str__(self):
+        return _iso_now()
+    
+    def __repr__(self):
+        return repr(_iso_now())
+
+
+class ResponseJSONEncoder(json.JSONEncoder):
+    """JSON encoder that renders lazy response timestamps."""
+    
+    def default(self, o):
+        if isinstance(o, _LazyISO):
+            return _iso_now()
+        return super().default(o)
+
+
+def _iso_now(_last=[0, ""]):
+    """Current UTC time in ISO format, cached at one-second resolution.
+    
+    Response stamps don't need sub-second precision, so the datetime
+    allocation and formatting run at most once per wall-clock second.
+    """
+    now = int(time.time())
+    if now != _last[0]:
+        _last[0] = now
+        _last[1] = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    return _last[1]
+
+
+class ResponseFormatter:
+    """Utilities for formatting API responses."""
+    
+    @staticmethod
+    def success_response(data: Any, message: str = "Success") -> Dict[str, Any]:
+        """Create successful API response."""
+        return {
+            "status": "success",
+            "message": message,
+            "data": data,
+            "timestamp": _iso_now()
+        }
+    
+    @staticmethod
+    def error_response(error: str, code: int = 500, details: Any = None) -> Dict[str, Any]:
+        """Create error API response."""
+        response = {
+            "status": "error",
+            "error": error,
+            "code": code,
+            "timestamp": _iso_now()
+        }
+        
+        if details:
+            response["details"] = details
+        
+        return response
+    
+    @staticmethod
+    def to_bytes(response: Dict[str, Any]) -> bytes:
+        """Serialize a response dict to JSON bytes.
+        
+        Uses orjson when available (3-10x faster than the stdlib encoder and
+        handles datetime natively); default=str also renders the lazy
+        timestamps. Falls back to stdlib json with ResponseJSONEncoder.
+        """
+        if orjson is not None:
+            return orjson.dumps(response, default=str)
+        return json.dumps(response, cls=ResponseJSONEncoder).encode('utf-8')
+    
+    @staticmethod
+    def format_agent_result(result: Dict[str, Any], agent_name: str) -> Dict[str, Any]:
+        """Format agent result for consistent API response."""
+        formatted = {
+            "agent": agent_name,
+            "status": result.get("status", "unknown"),
+            "timestamp": _LazyISO()
+        }
+        
+        # Add data based on status
+        if result.get("status") == "success":
+            # Remove status from data to avoid duplication
+            data = {k: v for k, v in result.items() if k != "status"}
+            formatted["data"] = data
+        else:
+            formatted["error"] = result.get("error", "Unknown error")
+        
+        return formatted
+
+
+# Convenience functions
+def get_logger(name: str) -> Logger:
+    """Get logger instance."""
+    return Logger(name)
+
+
+def load_config(config_file: str = ".env") -> ConfigManager:
+    """Load configuration."""
+    return ConfigManager(config_file)
+
+
+def time_operation(name: str):
+    """Decorator for timing operations."""
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            with PerformanceTimer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    # Test configuration manager
+    config = load_config()
+    print("🔧 Configuration loaded")
+    
+    # Test text processing
+    processor = TextProcessor()
+    sample_text = "This is a **sample** text with *formatting* and keywords about startup business model."
+    
+    keywords = processor.extract_keywords(sample_text)
+    print(f"📝 Keywords: {keywords}")
+    
+    cleaned = processor.clean_text(sample_text)
+    print(f"🧹 Cleaned text: {cleaned}")
+    
+    # Test validation
+    validator = DataValidator()
+    test_data = {
+        "project_data": "A mobile app for restaurants",
+        "team_info": "Small technical team"
+    }
+    
+    validation = validator.validate_project_data(test_data)
+    print(f"✅ Validation result: {validation}")
+    
+    # Test performance timer
+    with PerformanceTimer("Sample operation"):
+        time.sleep(0.1)  # Simulate work
+    
     print("🎯 Utils module test completed")
\ No newline at end of file
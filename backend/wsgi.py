@@ -1,29 +1,53 @@
-import os
-
-# Import the Flask app and orchestrator initializer
-try:
-    from backend.app import app, initialize_orchestrator
-except ImportError:
-    from app import app, initialize_orchestrator  # fallback for local runs
-
-# Initialize orchestrator on startup if enabled
-if os.getenv("INIT_ORCH_ON_STARTUP", "1") == "1":
-    try:
-        initialize_orchestrator()
-        print("✅ Orchestrator initialized successfully.")
-    except Exception as e:
-        print(f"⚠️ Orchestrator initialization failed: {e}")
-
-# Expose the Flask app for Gunicorn
-application = app  # optional alias, Gunicorn uses `app` below
-app = app  # keep this line so gunicorn backend.wsgi:app works
-
-# Optional local dev mode
-if __name__ == "__main__":
-    port = int(os.environ.get("PORT", 5000))
-    print(f"🚀 Starting Flask locally on 0.0.0.0:{port}")
-    try:
-        initialize_orchestrator()
-    except Exception as e:
-        print(f"⚠️ Local orchestrator init failed: {e}")
-    app.run(host="0.0.0.0", port=port)
+import logging
+import os
+
+
+def _resolve_app():
+    """Resolve the Flask app and initializer across launch styles."""
+    try:
+        from backend.app import app, initialize_orchestrator
+    except ImportError:
+        try:
+            from .app import app, initialize_orchestrator
+        except ImportError:
+            from app import app, initialize_orchestrator  # fallback for local runs
+    return app, initialize_orchestrator
+
+
+app, initialize_orchestrator = _resolve_app()
+
+log = logging.getLogger("optimizer.wsgi")
+
+_initialized = False
+
+
+def ensure_init():
+    """Initialize the orchestrator once, no matter how this module is entered.
+
+    Called at import time so that under `gunicorn --preload` (or
+    preload_app = True in gunicorn.conf.py) the FAISS index, embedding
+    model and tokenizer are loaded once in the master process and shared
+    copy-on-write with every worker.
+    """
+    global _initialized
+    if _initialized or getattr(app, "_orch_ready", False):
+        return
+    try:
+        initialize_orchestrator()
+        app._orch_ready = True
+        log.info("✅ Orchestrator initialized successfully.")
+    except Exception as e:
+        log.warning("⚠️ Orchestrator initialization failed: %s", e)
+    _initialized = True
+
+
+ensure_init()
+
+# Expose the Flask app for Gunicorn
+application = app  # optional alias, Gunicorn uses `app` below
+
+# Optional local dev mode
+if __name__ == "__main__":
+    port = int(os.environ.get("PORT", 5000))
+    log.info("🚀 Starting Flask locally on 0.0.0.0:%s", port)
+    app.run(host="0.0.0.0", port=port)
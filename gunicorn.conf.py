@@ -0,0 +1,14 @@
+# Gunicorn configuration for Optimizer
+#
+# Run with:
+#     gunicorn -c gunicorn.conf.py backend.wsgi:app
+#
+# preload_app loads backend/wsgi.py (and therefore the orchestrator, FAISS
+# index and embedding model) once in the master process before forking, so
+# the heavy read-only state is shared copy-on-write across all workers
+# instead of being loaded N times.
+
+preload_app = True
+workers = 4
+bind = "0.0.0.0:5000"
+timeout = 120